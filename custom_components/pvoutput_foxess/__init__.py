@@ -1,33 +1,81 @@
 """The PVOutput FoxESS integration."""
 from __future__ import annotations
 
+import os
+from functools import lru_cache
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
+from homeassistant.util.json import json_loads
+
+from .const import (
+    DOMAIN,
+    CONF_MODBUS_IP,
+    CONF_INVERTER_TYPE,
+    CONF_UPLOAD_INTERVAL,
+    CONF_PVOUTPUT_API_KEY,
+    CONF_PVOUTPUT_SYSTEM_ID,
+    CONF_SLAVE_ID,
+    DEFAULT_SLAVE_ID,
+)
+from .sensor import FoxESSDataCoordinator, PVOutputUploader
+
+PLATFORMS = [Platform.SENSOR, Platform.BUTTON]
+
+
+@lru_cache(maxsize=1)
+def _load_profiles_file(path: str, mtime: float) -> dict:
+    """Parse the inverter profiles file; mtime is only part of the cache key."""
+    # HA's json_loads is backed by orjson, which parses the raw bytes much faster than json
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+def _load_profiles() -> dict:
+    """Load the inverter profiles, shared by every entry and only re-parsed when the file changes."""
+    path = os.path.join(os.path.dirname(__file__), 'inverter_profiles.json')
+    return _load_profiles_file(path, os.path.getmtime(path))
 
-from .const import DOMAIN
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up PVOutput FoxESS from a config entry."""
     hass.data.setdefault(DOMAIN, {})
-    
-    # Store an empty dictionary for this config entry.
-    hass.data[DOMAIN][entry.entry_id] = {}
+    config = entry.data
+
+    # Load inverter profiles
+    inverter_profiles = await hass.async_add_executor_job(_load_profiles)
+    profile = inverter_profiles[config[CONF_INVERTER_TYPE]]
+
+    coordinator = FoxESSDataCoordinator(
+        hass, config[CONF_MODBUS_IP], profile, config[CONF_INVERTER_TYPE], config[CONF_UPLOAD_INTERVAL],
+        config.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID),
+    )
+
+    # Set up PVOutput uploader and pass it to the coordinator. The credentials are optional,
+    # and without them the inverter is only polled for its sensors.
+    pvoutput_uploader = None
+    if config.get(CONF_PVOUTPUT_API_KEY, "").strip() and config.get(CONF_PVOUTPUT_SYSTEM_ID, "").strip():
+        pvoutput_uploader = PVOutputUploader(hass, config, coordinator)
+    coordinator.set_pvoutput_uploader(pvoutput_uploader)
+    # Close the persistent Modbus connection and the uploader's session on unload, or if setup fails below
+    entry.async_on_unload(coordinator.async_shutdown)
+
+    await coordinator.async_config_entry_first_refresh()
+
+    # Both platforms read from here, so it must be populated before forwarding.
+    hass.data[DOMAIN][entry.entry_id] = {
+        "coordinator": coordinator,
+        "pvoutput_uploader": pvoutput_uploader,
+    }
+    entry.async_on_unload(lambda: hass.data[DOMAIN].pop(entry.entry_id, None))
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Forward the setup to the sensor platform. The sensor platform will set up the button platform.
-    await hass.config_entries.async_forward_entry_setups(entry, [Platform.SENSOR])
-    
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    # This is called when an integration is removed.
-    # It should clean up everything created in async_setup_entry
-    
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, [Platform.SENSOR, Platform.BUTTON])
-    
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
-
-    return unload_ok 
\ No newline at end of file
+    # Per-entry cleanup is registered with entry.async_on_unload in async_setup_entry
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -31,17 +31,10 @@ class PVOutputPushButton(ButtonEntity):
         self._coordinator = uploader._coordinator
         self._attr_name = f"Push to PVOutput"
         self._attr_unique_id = f"{self._coordinator.modbus_ip}-push_to_pvoutput"
-
-    @property
-    def device_info(self):
-        """Return device information to link the button to the correct device."""
-        return {
-            "identifiers": {(DOMAIN, self._coordinator.modbus_ip)},
-            "name": f"FoxESS {self._coordinator.modbus_ip}",
-            "manufacturer": "FoxESS",
-            "model": self._coordinator.inverter_type,
-        }
+        # Link the button to the same device as the sensors
+        self._attr_device_info = self._coordinator.device_info
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        await self._uploader.async_upload_data() 
\ No newline at end of file
+        # A manual push should always go out, even if nothing has changed
+        await self._uploader.async_upload_data(force=True) 
\ No newline at end of file
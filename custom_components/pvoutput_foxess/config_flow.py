@@ -1,17 +1,18 @@
 """Config flow for PVOutput FoxESS integration."""
 import json
 import logging
+from functools import lru_cache
 from typing import Any, Dict
 import os
 
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
 from homeassistant.helpers import selector
 import homeassistant.helpers.config_validation as cv
+from homeassistant.util.json import json_loads
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import aiohttp
 import asyncio
-from pymodbus.client import ModbusTcpClient
 
 from .const import (
     DOMAIN,
@@ -20,21 +21,48 @@ from .const import (
     CONF_PVOUTPUT_API_KEY,
     CONF_PVOUTPUT_SYSTEM_ID,
     CONF_UPLOAD_INTERVAL,
-    DEFAULT_UPLOAD_INTERVAL
+    CONF_SLAVE_ID,
+    DEFAULT_UPLOAD_INTERVAL,
+    DEFAULT_SLAVE_ID,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-def get_inverter_types():
-    """Load inverter types from the JSON file."""
+@lru_cache(maxsize=1)
+def _load_inverter_types() -> tuple[str, ...]:
+    """Load inverter types from the JSON file (blocking, cached per process)."""
     try:
         path = os.path.join(os.path.dirname(__file__), 'inverter_profiles.json')
-        with open(path, "r") as f:
-            return list(json.load(f).keys())
+        with open(path, "rb") as f:
+            return tuple(json_loads(f.read()).keys())
     except (FileNotFoundError, json.JSONDecodeError):
-        return ["AC1", "H1_G2", "H3_PRO"] # Fallback
+        return ("AC1", "H1_G2", "H3_PRO") # Fallback
 
-INVERTER_TYPES = get_inverter_types()
+
+@lru_cache(maxsize=1)
+def _user_schema(inverter_types: tuple[str, ...]) -> vol.Schema:
+    """Build the user step schema once for the loaded inverter types."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_MODBUS_IP): cv.string,
+            vol.Required(CONF_INVERTER_TYPE): selector.SelectSelector(
+                selector.SelectSelectorConfig(options=list(inverter_types), mode=selector.SelectSelectorMode.DROPDOWN),
+            ),
+            vol.Optional(CONF_SLAVE_ID, default=DEFAULT_SLAVE_ID): vol.All(vol.Coerce(int), vol.Range(min=1, max=247)),
+        }
+    )
+
+
+@lru_cache(maxsize=1)
+def _pvoutput_schema() -> vol.Schema:
+    """Build the PVOutput step schema once."""
+    return vol.Schema(
+        {
+            vol.Optional(CONF_PVOUTPUT_API_KEY): cv.string,
+            vol.Optional(CONF_PVOUTPUT_SYSTEM_ID): cv.string,
+            vol.Required(CONF_UPLOAD_INTERVAL, default=DEFAULT_UPLOAD_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+        }
+    )
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for PVOutput FoxESS."""
@@ -43,72 +71,49 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
     async def _validate_modbus_ip(self, ip: str) -> bool:
-        """Try to connect to the inverter via Modbus TCP."""
-        def try_connect():
-            client = ModbusTcpClient(ip, port=502)
-            try:
-                return client.connect()
-            finally:
-                if client.is_socket_open():
-                    client.close()
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, try_connect)
-
-    async def _validate_pvoutput_credentials(self, api_key: str, system_id: str) -> bool:
-        """Check PVOutput API key and system ID by calling getsystem.jsp."""
-        # Use getsystem.jsp for validation as it's simpler and more reliable
-        url = "https://pvoutput.org/service/r2/getsystem.jsp"
-        headers = {
-            "X-Pvoutput-Apikey": api_key,
-            "X-Pvoutput-SystemId": system_id,
-        }
+        """Try to open a TCP connection to the inverter's Modbus port."""
+        # Modbus TCP runs over plain TCP, so a completed handshake is all we need to check
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=10) as resp:
-                    # Read response text once (can only be read once)
-                    response_text = await resp.text()
-                    response_text = response_text.strip()
-                    
-                    # PVOutput returns 401 for invalid credentials
-                    if resp.status == 401:
-                        _LOGGER.debug(f"PVOutput returned 401: {response_text}")
-                        return False
-                    # Check for 200 status
-                    if resp.status != 200:
-                        _LOGGER.debug(f"PVOutput returned status {resp.status}: {response_text}")
-                        return False
-                    # Verify response contains valid data (getsystem.jsp returns CSV when successful)
-                    # Empty response or error messages indicate failure
-                    if not response_text or response_text.lower().startswith("error"):
-                        _LOGGER.debug(f"PVOutput returned invalid response: {response_text}")
-                        return False
-                    return True
-        except aiohttp.ClientError as e:
-            _LOGGER.error(f"PVOutput credential check failed (network error): {e}")
-            return False
-        except Exception as e:
-            _LOGGER.error(f"PVOutput credential check failed: {e}")
+            _, writer = await asyncio.wait_for(asyncio.open_connection(ip, 502), timeout=3.0)
+            writer.close()
+            await writer.wait_closed()
+            return True
+        except (OSError, asyncio.TimeoutError):
             return False
 
-    async def _fetch_pvoutput_system_name(self, api_key: str, system_id: str) -> str | None:
-        """Fetch the PVOutput system name using the API key and system ID."""
+    async def _fetch_pvoutput_system_name(self, api_key: str, system_id: str) -> tuple[bool, str | None]:
+        """Validate the PVOutput credentials and fetch the system name in one getsystem.jsp call.
+
+        Returns (valid, system_name). Raises aiohttp.ClientError if PVOutput could not be reached.
+        """
         url = "https://pvoutput.org/service/r2/getsystem.jsp"
         headers = {
             "X-Pvoutput-Apikey": api_key,
             "X-Pvoutput-SystemId": system_id,
         }
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=10) as resp:
-                    if resp.status == 200:
-                        text = await resp.text()
-                        # CSV: systemName,...
-                        parts = text.split(",")
-                        if len(parts) > 0:
-                            return parts[0].strip()
-        except Exception as e:
-            _LOGGER.error(f"Failed to fetch PVOutput system name: {e}")
-        return None
+        # Share Home Assistant's pooled session rather than opening a new connection
+        session = async_get_clientsession(self.hass)
+        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+            # Read response text once (can only be read once)
+            response_text = await resp.text()
+            response_text = response_text.strip()
+
+            # PVOutput returns 401 for invalid credentials
+            if resp.status in (401, 403):
+                _LOGGER.debug("PVOutput returned %s: %s", resp.status, response_text)
+                return False, None
+            if resp.status != 200:
+                _LOGGER.debug("PVOutput returned status %s: %s", resp.status, response_text)
+                raise aiohttp.ClientResponseError(
+                    resp.request_info, resp.history, status=resp.status, message=response_text
+                )
+            # Verify response contains valid data (getsystem.jsp returns CSV when successful)
+            # Empty response or error messages indicate failure
+            if not response_text or response_text.lower().startswith("error"):
+                _LOGGER.debug("PVOutput returned invalid response: %s", response_text)
+                return False, None
+            # CSV: systemName,...
+            return True, response_text.split(",")[0].strip()
 
     async def async_step_user(self, user_input: Dict[str, Any] | None = None) -> Dict[str, Any]:
         """Handle the initial step."""
@@ -122,17 +127,11 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 self.data = user_input
                 return await self.async_step_pvoutput()
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_MODBUS_IP): cv.string,
-                vol.Required(CONF_INVERTER_TYPE): selector.SelectSelector(
-                    selector.SelectSelectorConfig(options=INVERTER_TYPES, mode=selector.SelectSelectorMode.DROPDOWN),
-                ),
-            }
-        )
+        # Read the profiles file off the event loop; later calls hit the cache.
+        inverter_types = await self.hass.async_add_executor_job(_load_inverter_types)
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_user_schema(inverter_types),
             errors=errors
         )
 
@@ -143,29 +142,23 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.data.update(user_input)
             api_key = self.data.get(CONF_PVOUTPUT_API_KEY, "").strip()
             system_id = self.data.get(CONF_PVOUTPUT_SYSTEM_ID, "").strip()
+            system_name = None
             if api_key and system_id:
-                valid = await self._validate_pvoutput_credentials(api_key, system_id)
-                if not valid:
-                    errors[CONF_PVOUTPUT_API_KEY] = "invalid_api_key_or_system_id"
-                    errors[CONF_PVOUTPUT_SYSTEM_ID] = "invalid_api_key_or_system_id"
+                try:
+                    valid, system_name = await self._fetch_pvoutput_system_name(api_key, system_id)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    _LOGGER.error("PVOutput credential check failed (network error): %s", e)
+                    errors["base"] = "cannot_connect"
+                else:
+                    if not valid:
+                        errors[CONF_PVOUTPUT_API_KEY] = "invalid_api_key_or_system_id"
+                        errors[CONF_PVOUTPUT_SYSTEM_ID] = "invalid_api_key_or_system_id"
             if not errors:
-                # Try to fetch the PVOutput system name
-                system_name = None
-                if api_key and system_id:
-                    system_name = await self._fetch_pvoutput_system_name(api_key, system_id)
                 title = f"{system_name} - PV Output" if system_name else f"{self.data[CONF_MODBUS_IP]} - PV Output"
                 return self.async_create_entry(title=title, data=self.data)
 
-        data_schema = vol.Schema(
-            {
-                vol.Optional(CONF_PVOUTPUT_API_KEY): cv.string,
-                vol.Optional(CONF_PVOUTPUT_SYSTEM_ID): cv.string,
-                vol.Required(CONF_UPLOAD_INTERVAL, default=DEFAULT_UPLOAD_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
-            }
-        )
-        
         return self.async_show_form(
             step_id="pvoutput",
-            data_schema=data_schema,
+            data_schema=_pvoutput_schema(),
             errors=errors
         ) 
\ No newline at end of file
@@ -9,9 +9,11 @@ CONF_PVOUTPUT_API_KEY = "pvoutput_api_key"
 CONF_PVOUTPUT_SYSTEM_ID = "pvoutput_system_id"
 CONF_SEND_TO_PVOUTPUT = "send_to_pvoutput"
 CONF_UPLOAD_INTERVAL = "upload_interval"
+CONF_SLAVE_ID = "slave_id"
 
 # Defaults
 DEFAULT_UPLOAD_INTERVAL = 5
+DEFAULT_SLAVE_ID = 247
 
 # Inverter Types - will be loaded from inverter_profiles.json
 INVERTER_TYPES = [] 
\ No newline at end of file
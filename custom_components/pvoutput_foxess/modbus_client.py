@@ -1,16 +1,19 @@
 import asyncio
+import bisect
 import inspect
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 import socket
 import time
-from enum import Enum
+from enum import IntEnum
 from logging.handlers import RotatingFileHandler
 from typing import Any, Callable, TypeVar
 from dataclasses import dataclass
 
+import pymodbus
 from pymodbus.client import ModbusTcpClient
-from pymodbus.exceptions import ConnectionException
+from pymodbus.exceptions import ConnectionException, ModbusIOException
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,22 +23,68 @@ _pvoutput_logger = logging.getLogger('pvoutput_uploader')
 # Only add handler if not already added (to avoid duplicates)
 if not _pvoutput_logger.handlers:
     _pvoutput_logger.setLevel(logging.DEBUG)
-    handler = RotatingFileHandler(_pvoutput_log_file, maxBytes=5*1024*1024, backupCount=1)
+    # delay=True defers opening the file until the first record is written
+    handler = RotatingFileHandler(_pvoutput_log_file, maxBytes=5*1024*1024, backupCount=1, delay=True)
     formatter = logging.Formatter('%(asctime)s - [%(levelname)s] - %(name)s - %(message)s')
     handler.setFormatter(formatter)
     _pvoutput_logger.addHandler(handler)
 
+# File-only copy of messages also logged to _LOGGER. It doesn't propagate, so they aren't
+# repeated in the Home Assistant log the way _pvoutput_logger's records are
+_pvoutput_file_logger = logging.getLogger('pvoutput_uploader.modbus')
+_pvoutput_file_logger.propagate = False
+if not _pvoutput_file_logger.handlers:
+    for handler in _pvoutput_logger.handlers:
+        _pvoutput_file_logger.addHandler(handler)
+
 T = TypeVar("T")
 
+
+def _log_both(level: int, msg: str, *args: Any) -> None:
+    """Log a message once to the Home Assistant log and once to pvoutput_uploader.log.
+    
+    Both records report the caller's file, line and function.
+    """
+    _LOGGER.log(level, msg, *args, stacklevel=2)
+    _pvoutput_file_logger.log(level, "Modbus: " + msg, *args, stacklevel=2)
+
 # How many failed polls before we mark as disconnected
 _NUM_FAILED_POLLS_FOR_DISCONNECTION = 5
 
-# Poll delay for LAN connections (30ms)
-_POLL_DELAY = 30 / 1000
+# Starting poll delay for LAN connections (5ms). It doubles after a timeout, up to
+# _MAX_POLL_DELAY, and halves after _POLL_DELAY_RELAX_AFTER consecutive successful calls.
+_POLL_DELAY = 5 / 1000
+_MAX_POLL_DELAY = 100 / 1000
+_POLL_DELAY_RELAX_AFTER = 50
+
+# Maximum number of registers in a single read request (Modbus PDU limit)
+_MAX_REGISTERS_PER_READ = 125
+
+# Largest run of unused registers we will read through to merge two ranges into one request
+_MAX_READ_GAP = 8
+
+# Connect and read timeout for the Modbus socket (pymodbus's default)
+_SOCKET_TIMEOUT = 3
+
+# Cap for the back-off between reconnect attempts after consecutive connect failures (seconds)
+_MAX_CONNECT_BACKOFF = 30
+
+# Names pymodbus has used for the slave id keyword, in order of preference (newest first)
+_SLAVE_PARAM_NAMES = ('device_id', 'slave', 'unit')
+
+# Modbus exception code returned for registers the device does not implement
+_ILLEGAL_DATA_ADDRESS = 0x02
+
+# Consecutive unanswered reads after which the rest of a block's fallback reads are skipped
+_MAX_UNANSWERED_READS = 3
+
+# Detected (use_positional, slave_param_name, use_keyword_count) per pymodbus version.
+# The installed pymodbus is constant for the life of the process, so detection only runs once.
+_PARAM_STYLE_CACHE: dict[str, tuple[bool | None, str | None, bool]] = {}
 
 
-class ConnectionState(Enum):
-    """Connection state enum."""
+class ConnectionState(IntEnum):
+    """Connection state enum, ordered so CONNECTED compares highest."""
     INITIAL = 0
     DISCONNECTED = 1
     CONNECTED = 2
@@ -43,7 +92,10 @@ class ConnectionState(Enum):
 
 @dataclass
 class InvalidRegisterRanges:
-    """Tracks invalid register ranges."""
+    """Tracks invalid register ranges.
+    
+    Ranges are kept sorted and merged as parallel start/end lists, so lookups are a binary search.
+    """
     
     @dataclass
     class Range:
@@ -51,25 +103,59 @@ class InvalidRegisterRanges:
         count: int
     
     def __init__(self) -> None:
-        self._ranges: list[InvalidRegisterRanges.Range] = []
+        self._starts: list[int] = []
+        self._ends: list[int] = []  # Exclusive
     
     @property
     def is_empty(self) -> bool:
-        return len(self._ranges) == 0
+        return len(self._starts) == 0
     
     def add(self, register: int) -> None:
         """Add an invalid register."""
-        # Check if it falls in any existing range
-        for x in self._ranges:
-            if register >= x.start and register < (x.start + x.count):
-                return  # Already covered
-            if register == (x.start + x.count):
-                x.count += 1
-                return
-        self._ranges.append(self.Range(register, 1))
+        starts, ends = self._starts, self._ends
+        i = bisect.bisect_right(starts, register) - 1
+        if i >= 0 and register < ends[i]:
+            return  # Already covered
+        if i >= 0 and register == ends[i]:
+            ends[i] += 1
+            # Merge with the next range if this closed the gap
+            if i + 1 < len(starts) and starts[i + 1] == ends[i]:
+                ends[i] = ends[i + 1]
+                del starts[i + 1]
+                del ends[i + 1]
+            return
+        if i + 1 < len(starts) and starts[i + 1] == register + 1:
+            starts[i + 1] = register
+            return
+        starts.insert(i + 1, register)
+        ends.insert(i + 1, register + 1)
     
     def __contains__(self, item: int) -> bool:
-        return any(item >= x.start and item < x.start + x.count for x in self._ranges)
+        i = bisect.bisect_right(self._starts, item) - 1
+        return i >= 0 and item < self._ends[i]
+    
+    def covers(self, start: int, count: int) -> bool:
+        """Return True if every register in the range is invalid."""
+        # Adjacent ranges are always merged, so a covered range lies within a single entry
+        i = bisect.bisect_right(self._starts, start) - 1
+        return i >= 0 and start + count <= self._ends[i]
+    
+    def subtract(self, start: int, count: int) -> "list[InvalidRegisterRanges.Range]":
+        """Return the valid sub-ranges of the given range."""
+        starts, ends = self._starts, self._ends
+        end = start + count
+        valid: list[InvalidRegisterRanges.Range] = []
+        position = start
+        i = max(bisect.bisect_right(starts, start) - 1, 0)
+        while position < end and i < len(starts) and starts[i] < end:
+            if ends[i] > position:
+                if starts[i] > position:
+                    valid.append(self.Range(position, starts[i] - position))
+                position = ends[i]
+            i += 1
+        if position < end:
+            valid.append(self.Range(position, end - position))
+        return valid
 
 
 class CustomModbusTcpClient(ModbusTcpClient):
@@ -82,22 +168,77 @@ class CustomModbusTcpClient(ModbusTcpClient):
         self._port = port
         self._delay_on_connect = delay_on_connect
     
-    def connect(self) -> bool:
-        """Connect with optimizations."""
+    @property
+    def delay_on_connect(self) -> float:
+        """Seconds to wait after a new connection before sending requests."""
+        return self._delay_on_connect
+    
+    def connect(self, delay: bool = True) -> bool:
+        """Connect with optimizations.
+        
+        ImprovedModbusClient connects on the event loop and calls attach_socket() instead; this
+        blocking path remains for pymodbus reconnecting internally.
+        Pass delay=False when the caller waits out delay_on_connect itself (e.g. with asyncio.sleep).
+        """
         was_connected = self.socket is not None
         if not was_connected:
-            _LOGGER.debug("Connecting to %s:%s", self._host, self._port)
-            _pvoutput_logger.debug(f"Modbus: Connecting to {self._host}:{self._port}")
+            _pvoutput_logger.debug("Modbus: Connecting to %s:%s", self._host, self._port)
         
         is_connected = super().connect()
         
-        # Disable Nagle's algorithm for faster response times
         if not was_connected and is_connected and self.socket:
-            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
-            if self._delay_on_connect > 0:
+            self._configure_socket()
+            if delay and self._delay_on_connect > 0:
                 time.sleep(self._delay_on_connect)
         
         return is_connected
+    
+    def attach_socket(self, sock: socket.socket) -> None:
+        """Use a socket that was connected elsewhere (e.g. on the event loop) for this client."""
+        self.socket = sock
+        self._configure_socket()
+    
+    def _configure_socket(self) -> None:
+        """Tune a newly opened socket for small request/response exchanges."""
+        # Disable Nagle's algorithm for faster response times
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
+        self.quickack()
+        # Send keepalive probes on the idle connection between polls so a dead peer is noticed
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, True)
+        # The TCP_* tuning below is Linux-only, so each option is applied only where it exists
+        for option, value in (
+            # Start probing after 30 s idle instead of the kernel's 2 h default
+            ("TCP_KEEPIDLE", 30),
+            # Probe every 10 s instead of the kernel's 75 s, and give up after 3 unanswered probes,
+            # so an idle connection to a dead peer is dropped within 30 + 10 * 3 = 60 s
+            ("TCP_KEEPINTVL", 10),
+            ("TCP_KEEPCNT", 3),
+            # Fail the connection once a sent request has gone unacknowledged for 5 s, instead of
+            # retransmitting for the kernel's default of about 15 minutes. This only bounds sent data;
+            # idle connections are covered by the keepalive settings above
+            ("TCP_USER_TIMEOUT", 5000),
+        ):
+            if hasattr(socket, option):
+                try:
+                    self.socket.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+                except OSError:
+                    pass
+        # Modbus responses are at most a few hundred bytes, so a small receive buffer is plenty
+        try:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8192)
+        except OSError:
+            pass
+    
+    def quickack(self) -> None:
+        """Ask the kernel to ACK immediately rather than delaying (Linux only).
+        
+        TCP_QUICKACK is reset by the kernel, so this is re-applied after every request.
+        """
+        if self.socket and hasattr(socket, "TCP_QUICKACK"):
+            try:
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, True)
+            except OSError:
+                pass
 
 
 class ModbusClientFailedError(Exception):
@@ -112,98 +253,278 @@ class ModbusClientFailedError(Exception):
 class ImprovedModbusClient:
     """Improved Modbus client with async wrapper, locking, and optimizations."""
     
-    def __init__(self, hass: Any, host: str, port: int = 502, slave: int = 247) -> None:
+    def __init__(
+        self, hass: Any, host: str, port: int = 502, slave: int = 247, poll_delay: float | None = None
+    ) -> None:
         """Initialize improved Modbus client."""
         self._hass = hass
         self._host = host
         self._port = port
         self._slave = slave
-        self._lock = asyncio.Lock()
+        self._slave_verified = False  # Set once the inverter has answered on this unit id
+        # A single dedicated worker serialises Modbus calls and keeps them off Home Assistant's shared pool
+        self._executor: ThreadPoolExecutor | None = None
         self._client: CustomModbusTcpClient | None = None
         self._connection_state = ConnectionState.INITIAL
         self._num_failed_poll_attempts = 0
+        self._num_failed_connects = 0
+        self._poll_delay = _POLL_DELAY if poll_delay is None else poll_delay
+        self._num_calls_since_timeout = 0
+        self._next_connect_attempt = 0.0  # time.monotonic() before which we will not try to reconnect
         self._current_connection_error: str | None = None
         self._detected_invalid_ranges = InvalidRegisterRanges()
         self._use_positional = None  # Will be detected on first use
         self._slave_param_name = None  # Will be 'slave', 'unit', or 'device_id' when detected
         self._use_keyword_count = False  # Whether count must be passed as keyword argument
+        self._read_fn: Callable[[int, int], Any] | None = None  # Built once the parameter style is known
+        self._registers_are_list: bool | None = None  # Whether pymodbus returns registers as a list
+    
+    async def connect(self) -> bool:
+        """Connect to the inverter, waiting out the connect delay without blocking the worker thread."""
+        if not self._client:
+            self._client = CustomModbusTcpClient(self._host, port=self._port, delay_on_connect=1.0)
+            _pvoutput_logger.debug("Modbus: Created client for %s:%s", self._host, self._port)
+        if self._client.is_socket_open():
+            return True
+        
+        # Back off after consecutive failures rather than hammering an unreachable inverter
+        if time.monotonic() < self._next_connect_attempt:
+            return False
+        
+        client = self._client
+        try:
+            client.attach_socket(await self._open_socket())
+        except (OSError, asyncio.TimeoutError) as e:
+            self._num_failed_connects += 1
+            backoff = min(2 ** self._num_failed_connects, _MAX_CONNECT_BACKOFF)
+            self._next_connect_attempt = time.monotonic() + backoff
+            _pvoutput_logger.debug(
+                "Modbus: Failed to connect to %s:%s (%s), next attempt in %s s", self._host, self._port, e, backoff
+            )
+            return False
+        
+        self._num_failed_connects = 0
+        self._next_connect_attempt = 0.0
+        if client.delay_on_connect > 0:
+            await asyncio.sleep(client.delay_on_connect)
+        return True
+    
+    async def _open_socket(self) -> socket.socket:
+        """Open a TCP connection on the event loop, returning a blocking socket for the sync client."""
+        _pvoutput_logger.debug("Modbus: Connecting to %s:%s", self._host, self._port)
+        loop = asyncio.get_running_loop()
+        # Resolve first so a hostname gets the address family it actually resolves to
+        infos = await asyncio.wait_for(
+            loop.getaddrinfo(self._host, self._port, type=socket.SOCK_STREAM), _SOCKET_TIMEOUT
+        )
+        family, type_, proto, _, sockaddr = infos[0]
+        sock = socket.socket(family, type_, proto)
+        sock.setblocking(False)
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, sockaddr), _SOCKET_TIMEOUT)
+        except BaseException:
+            sock.close()
+            raise
+        # The sync pymodbus client expects a blocking socket with a timeout
+        sock.settimeout(_SOCKET_TIMEOUT)
+        return sock
+    
+    async def ensure_connected(self) -> bool:
+        """Make sure the connection is open before polling, recording a failure if it cannot be opened."""
+        if await self.connect():
+            return True
+        self._update_connection_state(False, ConnectionException(f"Failed to connect to {self._host}:{self._port}"))
+        return False
+    
+    async def verify_slave(self, start_address: int, count: int) -> bool:
+        """Check once that the inverter answers on the configured unit id.
+        
+        Any reply counts, including an exception response for the probed registers. Only a
+        missing reply suggests the unit id is wrong, which would otherwise fail every read.
+        """
+        if self._slave_verified:
+            return True
+        try:
+            await self.read_holding_registers(start_address, count)
+        except ModbusClientFailedError as e:
+            if getattr(e.response, "exception_code", None) is None:
+                _log_both(logging.WARNING, "No response from unit id %s at %s:%s", self._slave, self._host, self._port)
+                return False
+        except ModbusIOException:
+            _log_both(logging.WARNING, "No response from unit id %s at %s:%s", self._slave, self._host, self._port)
+            return False
+        self._slave_verified = True
+        return True
     
     async def close(self) -> None:
         """Close connection."""
         if self._client and self._client.is_socket_open():
-            await self._async_pymodbus_call(self._client.close, auto_connect=False)
+            await self._async_pymodbus_call(self._client.close, auto_connect=False, post_delay=0)
             self._client = None
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    async def _drop_socket(self) -> None:
+        """Close the socket after a connection error, keeping the client for the reconnect."""
+        if self._client:
+            _pvoutput_logger.debug("Modbus: Dropping connection to %s:%s after an error", self._host, self._port)
+            await self._run_in_executor(self._client.close)
     
     @property
     def is_connected(self) -> bool:
         """Return if connected."""
-        return self._connection_state == ConnectionState.INITIAL or self._connection_state == ConnectionState.CONNECTED
+        return self._connection_state >= ConnectionState.CONNECTED
     
     @property
     def current_connection_error(self) -> str | None:
         """Return current connection error."""
         return self._current_connection_error
     
-    async def read_holding_registers(self, start_address: int, count: int) -> list[int]:
-        """Read holding registers."""
+    async def read_holding_registers(self, start_address: int, count: int) -> list[int | None]:
+        """Read holding registers.
+        
+        Registers already known to be invalid are not requested and come back as None.
+        """
+        invalid = self._detected_invalid_ranges
+        if not invalid.is_empty:
+            if invalid.covers(start_address, count):
+                raise ModbusClientFailedError(
+                    f"Registers are known to be invalid. Start: {start_address}; count: {count}", None
+                )
+            valid_ranges = invalid.subtract(start_address, count)
+            if len(valid_ranges) > 1 or valid_ranges[0].count != count:
+                registers: list[int | None] = [None] * count
+                for r in valid_ranges:
+                    offset = r.start - start_address
+                    registers[offset:offset + r.count] = await self._read_registers(r.start, r.count)
+                return registers
+        
+        return await self._read_registers(start_address, count)
+    
+    async def _read_registers(self, start_address: int, count: int, record_invalid: bool = True) -> list[int]:
+        """Issue a single read request, optionally recording illegal addresses as invalid."""
         if not self._client:
             self._client = CustomModbusTcpClient(self._host, port=self._port, delay_on_connect=1.0)
-            _pvoutput_logger.debug(f"Modbus: Created client for {self._host}:{self._port}")
+            _pvoutput_logger.debug("Modbus: Created client for %s:%s", self._host, self._port)
         
         # Detect parameter style on first use
-        if self._use_positional is None:
+        if self._read_fn is None:
             _pvoutput_logger.debug("Modbus: Detecting parameter style...")
             await self._detect_parameter_style()
+            self._read_fn = self._build_read_fn()
         
-        # Read registers - handle positional vs keyword arguments
-        if self._use_positional is True:
-            # Positional: address, count, slave
-            response = await self._async_pymodbus_call(
-                self._client.read_holding_registers,
-                start_address,
-                count,
-                self._slave,
-            )
-        elif self._use_positional is False:
-            # Use keyword argument - use the detected parameter name
-            if self._slave_param_name is None:
-                # Should not happen, but fallback to 'slave'
-                self._slave_param_name = 'slave'
-            
-            kwargs = {self._slave_param_name: self._slave}
-            # If device_id is used, count must also be a keyword argument
-            if self._use_keyword_count:
-                kwargs['count'] = count
-                response = await self._async_pymodbus_call(
-                    self._client.read_holding_registers,
-                    start_address,
-                    **kwargs,
-                )
-            else:
-                response = await self._async_pymodbus_call(
-                    self._client.read_holding_registers,
-                    start_address,
-                    count,
-                    **kwargs,
-                )
-        else:
-            # No slave/unit parameter needed (maybe set on client or not required)
-            response = await self._async_pymodbus_call(
-                self._client.read_holding_registers,
-                start_address,
-                count,
-            )
+        response = await self._async_pymodbus_call(self._read_fn, start_address, count)
         
         if response.isError():
             error_msg = f"Error reading registers. Start: {start_address}; count: {count}; slave: {self._slave}"
-            _pvoutput_logger.error(f"Modbus: {error_msg} - {response}")
+            _pvoutput_logger.error("Modbus: %s - %s", error_msg, response)
+            if record_invalid and getattr(response, "exception_code", None) == _ILLEGAL_DATA_ADDRESS:
+                # The inverter does not implement these registers, so stop asking for them
+                for register in range(start_address, start_address + count):
+                    self._detected_invalid_ranges.add(register)
+                _pvoutput_logger.debug("Modbus: Marked %s register(s) starting at %s as invalid", count, start_address)
             raise ModbusClientFailedError(error_msg, response)
         
-        _pvoutput_logger.debug(f"Modbus: Successfully read {count} register(s) starting at {start_address}")
-        return list(response.registers)
+        _pvoutput_logger.debug("Modbus: Successfully read %s register(s) starting at %s", count, start_address)
+        # pymodbus already hands back a fresh list, so only copy if this version does not
+        if self._registers_are_list is None:
+            self._registers_are_list = isinstance(response.registers, list)
+        return response.registers if self._registers_are_list else list(response.registers)
+    
+    async def read_block(
+        self, block_start: int, block_count: int, members: list[tuple[int, int]]
+    ) -> list[int | None]:
+        """Read one block from plan_blocks, returning None for registers of members that failed."""
+        try:
+            if len(members) == 1:
+                return await self.read_holding_registers(block_start, block_count)
+            # An illegal address in a merged block says nothing about which member is at fault
+            return await self._read_registers(block_start, block_count, record_invalid=False)
+        except ModbusClientFailedError:
+            if len(members) == 1:
+                return [None] * block_count
+
+        # One bad address fails the whole block, so fall back to reading each range on its own
+        _pvoutput_logger.debug(
+            "Modbus: Block read of %s register(s) at %s failed, reading %s range(s) individually",
+            block_count, block_start, len(members),
+        )
+        registers: list[int | None] = [None] * block_count
+        num_unanswered = 0
+        for start, count in members:
+            try:
+                values = await self.read_holding_registers(start, count)
+            except ModbusClientFailedError as e:
+                # Rejected addresses are answered at once, but repeated missing replies mean the
+                # inverter has stopped responding, so don't wait out a timeout for every member.
+                # Only pymodbus versions that return a timeout rather than raise it get here;
+                # a raised ModbusIOException already ends the whole block read
+                if isinstance(e.response, ModbusIOException):
+                    num_unanswered += 1
+                    if num_unanswered >= _MAX_UNANSWERED_READS:
+                        break
+                else:
+                    num_unanswered = 0
+                continue
+            num_unanswered = 0
+            offset = start - block_start
+            registers[offset:offset + count] = values
+        return registers
+
+    def plan_blocks(
+        self, ranges: list[tuple[int, int]]
+    ) -> list[tuple[int, int, list[tuple[int, int]]]]:
+        """Group ranges into (start, count, members) read blocks, avoiding known-invalid registers."""
+        blocks: list[tuple[int, int, list[tuple[int, int]]]] = []
+        for start, count in sorted(set(ranges)):
+            if any(r in self._detected_invalid_ranges for r in range(start, start + count)):
+                continue
+            if blocks:
+                block_start, block_count, members = blocks[-1]
+                block_end = block_start + block_count
+                new_end = max(block_end, start + count)
+                if (
+                    start - block_end <= _MAX_READ_GAP
+                    and new_end - block_start <= _MAX_REGISTERS_PER_READ
+                    and not any(r in self._detected_invalid_ranges for r in range(block_end, start))
+                ):
+                    members.append((start, count))
+                    blocks[-1] = (block_start, new_end - block_start, members)
+                    continue
+            blocks.append((start, count, [(start, count)]))
+        return blocks
+
+    def _build_read_fn(self) -> Callable[[int, int], Any]:
+        """Build a read function specialised for the detected parameter style."""
+        slave = self._slave
+        if self._use_positional is True:
+            # Positional: address, count, slave
+            return lambda address, count: self._client.read_holding_registers(address, count, slave)
+        if self._use_positional is False:
+            if self._slave_param_name == 'device_id':
+                # If device_id is used, count must also be a keyword argument
+                return lambda address, count: self._client.read_holding_registers(address, count=count, device_id=slave)
+            if self._slave_param_name == 'unit':
+                return lambda address, count: self._client.read_holding_registers(address, count, unit=slave)
+            return lambda address, count: self._client.read_holding_registers(address, count, slave=slave)
+        # No slave/unit parameter needed (maybe set on client or not required)
+        return lambda address, count: self._client.read_holding_registers(address, count)
     
     async def _detect_parameter_style(self) -> None:
-        """Detect whether to use positional or keyword arguments."""
+        """Detect whether to use positional or keyword arguments, reusing an earlier result if possible."""
+        version = getattr(pymodbus, "__version__", "unknown")
+        cached = _PARAM_STYLE_CACHE.get(version)
+        if cached is not None:
+            self._use_positional, self._slave_param_name, self._use_keyword_count = cached
+            _pvoutput_logger.debug("Modbus: Using cached parameter style for pymodbus %s: %s", version, cached)
+            return
+        
+        if await self._probe_parameter_style():
+            _PARAM_STYLE_CACHE[version] = (self._use_positional, self._slave_param_name, self._use_keyword_count)
+    
+    async def _probe_parameter_style(self) -> bool:
+        """Work out the parameter style from the signature, falling back to live reads. Returns True on success."""
         if not self._client:
             self._client = CustomModbusTcpClient(self._host, port=self._port, delay_on_connect=1.0)
         
@@ -211,39 +532,24 @@ class ImprovedModbusClient:
         
         # First, inspect the actual function signature to see what parameters it accepts
         try:
-            import inspect
             sig = inspect.signature(self._client.read_holding_registers)
             params = list(sig.parameters.keys())
-            _LOGGER.debug(f"read_holding_registers signature parameters: {params}")
+            _LOGGER.debug("read_holding_registers signature parameters: %s", params)
             
             # Check if it has 'device_id', 'slave', or 'unit' parameter
-            if 'device_id' in params:
-                self._use_positional = False
-                self._slave_param_name = 'device_id'
-                self._use_keyword_count = True  # New flag: count must be keyword too
-                _LOGGER.debug("Detected 'device_id' parameter in signature")
-                _pvoutput_logger.debug(f"Modbus: Detected 'device_id' parameter in signature. Available parameters: {params}")
-                return
-            elif 'slave' in params:
-                self._use_positional = False
-                self._slave_param_name = 'slave'
-                self._use_keyword_count = False
-                _LOGGER.debug("Detected 'slave' parameter in signature")
-                _pvoutput_logger.debug(f"Modbus: Detected 'slave' parameter in signature. Available parameters: {params}")
-                return
-            elif 'unit' in params:
-                self._use_positional = False
-                self._slave_param_name = 'unit'
-                self._use_keyword_count = False
-                _LOGGER.debug("Detected 'unit' parameter in signature")
-                _pvoutput_logger.debug(f"Modbus: Detected 'unit' parameter in signature. Available parameters: {params}")
-                return
-            else:
-                # No slave/unit/device_id parameter - might be positional or set on client
-                _LOGGER.debug(f"No 'slave', 'unit', or 'device_id' parameter found. Available parameters: {params}")
-                _pvoutput_logger.debug(f"Modbus: No 'slave', 'unit', or 'device_id' parameter found. Available parameters: {params}")
+            param_set = frozenset(params)
+            for name in _SLAVE_PARAM_NAMES:
+                if name in param_set:
+                    self._use_positional = False
+                    self._slave_param_name = name
+                    self._use_keyword_count = name == 'device_id'  # device_id also needs count as a keyword
+                    _pvoutput_logger.debug("Modbus: Detected '%s' parameter in signature. Available parameters: %s", name, params)
+                    return True
+            
+            # No slave/unit/device_id parameter - might be positional or set on client
+            _pvoutput_logger.debug("Modbus: No 'slave', 'unit', or 'device_id' parameter found. Available parameters: %s", params)
         except Exception as e:
-            _LOGGER.debug(f"Could not inspect signature: {e}")
+            _LOGGER.debug("Could not inspect signature: %s", e)
         
         # Try keyword 'device_id' first (newest pymodbus versions)
         try:
@@ -257,12 +563,10 @@ class ImprovedModbusClient:
                 self._use_positional = False
                 self._slave_param_name = 'device_id'
                 self._use_keyword_count = True
-                _LOGGER.debug("Detected pymodbus uses keyword 'device_id' parameter")
                 _pvoutput_logger.debug("Modbus: Detected pymodbus uses keyword 'device_id' parameter")
-                return
+                return True
         except (TypeError, AttributeError) as e:
-            _LOGGER.debug(f"Keyword 'device_id' failed: {e}")
-            _pvoutput_logger.debug(f"Modbus: Keyword 'device_id' failed: {e}")
+            _pvoutput_logger.debug("Modbus: Keyword 'device_id' failed: %s", e)
         
         # Try keyword 'slave' (older pymodbus versions)
         try:
@@ -276,12 +580,10 @@ class ImprovedModbusClient:
                 self._use_positional = False
                 self._slave_param_name = 'slave'
                 self._use_keyword_count = False
-                _LOGGER.debug("Detected pymodbus uses keyword 'slave' parameter")
                 _pvoutput_logger.debug("Modbus: Detected pymodbus uses keyword 'slave' parameter")
-                return
+                return True
         except (TypeError, AttributeError) as e:
-            _LOGGER.debug(f"Keyword 'slave' failed: {e}")
-            _pvoutput_logger.debug(f"Modbus: Keyword 'slave' failed: {e}")
+            _pvoutput_logger.debug("Modbus: Keyword 'slave' failed: %s", e)
         
         # Try keyword 'unit' (newer pymodbus versions)
         try:
@@ -295,12 +597,10 @@ class ImprovedModbusClient:
                 self._use_positional = False
                 self._slave_param_name = 'unit'
                 self._use_keyword_count = False
-                _LOGGER.debug("Detected pymodbus uses keyword 'unit' parameter")
                 _pvoutput_logger.debug("Modbus: Detected pymodbus uses keyword 'unit' parameter")
-                return
+                return True
         except (TypeError, AttributeError) as e:
-            _LOGGER.debug(f"Keyword 'unit' failed: {e}")
-            _pvoutput_logger.debug(f"Modbus: Keyword 'unit' failed: {e}")
+            _pvoutput_logger.debug("Modbus: Keyword 'unit' failed: %s", e)
         
         # Try positional last (older pymodbus versions
         try:
@@ -314,12 +614,10 @@ class ImprovedModbusClient:
                 self._use_positional = True
                 self._slave_param_name = None  # Not used for positional
                 self._use_keyword_count = False
-                _LOGGER.debug("Detected pymodbus accepts positional 'slave' parameter")
                 _pvoutput_logger.debug("Modbus: Detected pymodbus accepts positional 'slave' parameter")
-                return
+                return True
         except (TypeError, AttributeError) as e:
-            _LOGGER.debug(f"Positional parameter failed: {e}")
-            _pvoutput_logger.debug(f"Modbus: Positional parameter failed: {e}")
+            _pvoutput_logger.debug("Modbus: Positional parameter failed: %s", e)
         
         # Try without any slave/unit parameter (maybe it's set on the client)
         try:
@@ -332,12 +630,10 @@ class ImprovedModbusClient:
                 self._use_positional = None  # Special value meaning no parameter needed
                 self._slave_param_name = None
                 self._use_keyword_count = False
-                _LOGGER.debug("Detected pymodbus does not require slave/unit parameter")
                 _pvoutput_logger.debug("Modbus: Detected pymodbus does not require slave/unit parameter")
-                return
+                return True
         except (TypeError, AttributeError) as e:
-            _LOGGER.debug(f"No parameter failed: {e}")
-            _pvoutput_logger.debug(f"Modbus: No parameter failed: {e}")
+            _pvoutput_logger.debug("Modbus: No parameter failed: %s", e)
         
         # If all failed, log error with signature info
         error_msg = (
@@ -345,35 +641,84 @@ class ImprovedModbusClient:
             "Tried: keyword 'device_id', keyword 'slave', keyword 'unit', positional, and no parameter. "
             "Please check pymodbus version compatibility."
         )
-        _LOGGER.error(error_msg)
-        _pvoutput_logger.error(f"Modbus: {error_msg}")
+        _log_both(logging.ERROR, "%s", error_msg)
         # Default to trying device_id with keyword count (most likely for newer versions)
         self._use_positional = False
         self._slave_param_name = 'device_id'
         self._use_keyword_count = True
+        return False
     
     async def _async_pymodbus_call(
-        self, call: Callable[..., T], *args: Any, auto_connect: bool = True, **kwargs: Any
+        self,
+        call: Callable[..., T],
+        *args: Any,
+        auto_connect: bool = True,
+        post_delay: float | None = None,
+        **kwargs: Any,
     ) -> T:
-        """Convert async to sync pymodbus call with locking."""
+        """Run a sync pymodbus call on the client's dedicated worker thread.
+        
+        post_delay overrides the adaptive poll delay slept after the call; pass 0 to skip it.
+        """
+        
+        if not self._client:
+            raise ConnectionException("Client not initialized")
+        
+        # Only reconnect when the socket has actually gone away
+        if auto_connect and not self._client.is_socket_open():
+            if not await self.connect():
+                raise ConnectionException(f"Failed to connect to {self._host}:{self._port}")
         
         def _call() -> T:
             if not self._client:
                 raise ConnectionException("Client not initialized")
             
-            if auto_connect and not self._client.connected:
-                if not self._client.connect():
-                    raise ConnectionException(f"Failed to connect to {self._host}:{self._port}")
-            
             # Call with provided args and kwargs
-            return call(*args, **kwargs)
-        
-        async with self._lock:
-            result = await self._hass.async_add_executor_job(_call)
-            # Poll delay for stability
-            if _POLL_DELAY > 0:
-                await asyncio.sleep(_POLL_DELAY)
+            result = call(*args, **kwargs)
+            self._client.quickack()
             return result
+        
+        try:
+            result = await self._run_in_executor(_call)
+        except ModbusIOException:
+            self._adapt_poll_delay(timed_out=True)
+            raise
+        except (ConnectionException, OSError):
+            # The connection is otherwise kept across polls, so a broken one must be dropped
+            # here for the next call to open a fresh socket instead of reusing a dead one
+            await self._drop_socket()
+            raise
+        # Older pymodbus versions return the timeout rather than raising it
+        self._adapt_poll_delay(timed_out=isinstance(result, ModbusIOException))
+        
+        # Poll delay for stability
+        if post_delay is None:
+            post_delay = self._poll_delay
+        if post_delay > 0:
+            await asyncio.sleep(post_delay)
+        return result
+    
+    def _adapt_poll_delay(self, timed_out: bool) -> None:
+        """Back the poll delay off after a timeout and relax it again while calls succeed."""
+        if timed_out:
+            self._num_calls_since_timeout = 0
+            self._poll_delay = min(max(self._poll_delay * 2, _POLL_DELAY), _MAX_POLL_DELAY)
+            _pvoutput_logger.debug("Modbus: Timeout, poll delay increased to %.3f s", self._poll_delay)
+            return
+        
+        self._num_calls_since_timeout += 1
+        if self._poll_delay and self._num_calls_since_timeout >= _POLL_DELAY_RELAX_AFTER:
+            self._num_calls_since_timeout = 0
+            # Snap to zero once the delay is negligible so the sleep is skipped entirely
+            self._poll_delay = self._poll_delay / 2 if self._poll_delay >= 2 / 1000 else 0.0
+    
+    async def _run_in_executor(self, func: Callable[[], T]) -> T:
+        """Run a blocking function on the client's dedicated worker thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"modbus-{self._host}")
+        
+        # With a single worker, calls run one at a time in submission order, so no lock is needed
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
     
     def _update_connection_state(self, success: bool, error: Exception | None = None) -> None:
         """Update connection state based on operation result."""
@@ -382,8 +727,7 @@ class ImprovedModbusClient:
             if self._connection_state == ConnectionState.INITIAL:
                 self._connection_state = ConnectionState.CONNECTED
             elif self._connection_state == ConnectionState.DISCONNECTED:
-                _LOGGER.info("Connection restored to %s:%s", self._host, self._port)
-                _pvoutput_logger.info(f"Modbus: Connection restored to {self._host}:{self._port}")
+                _log_both(logging.INFO, "Connection restored to %s:%s", self._host, self._port)
                 self._connection_state = ConnectionState.CONNECTED
                 self._current_connection_error = None
         else:
@@ -391,14 +735,12 @@ class ImprovedModbusClient:
             if self._num_failed_poll_attempts >= _NUM_FAILED_POLLS_FOR_DISCONNECTION:
                 if self._connection_state != ConnectionState.DISCONNECTED:
                     error_msg = str(error) if error else "Unknown error"
-                    _LOGGER.warning(
+                    _log_both(
+                        logging.WARNING,
                         "%s failed poll attempts: now disconnected. Last error: %s",
                         self._num_failed_poll_attempts,
                         error_msg,
                     )
-                    _pvoutput_logger.warning(
-                        f"Modbus: {self._num_failed_poll_attempts} failed poll attempts: now disconnected. Last error: {error_msg}"
-                    )
                     self._connection_state = ConnectionState.DISCONNECTED
                     self._current_connection_error = error_msg
     
@@ -1,19 +1,19 @@
 """Sensor platform for PVOutput FoxESS."""
-import json
 import logging
-import inspect
 from logging.handlers import RotatingFileHandler
 from datetime import timedelta, datetime
 import os
 import asyncio
+import operator
+import struct
+from urllib.parse import urlencode
 import aiohttp
 
-import requests
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from .modbus_client import ImprovedModbusClient, ModbusClientFailedError
+from .modbus_client import ImprovedModbusClient
 from homeassistant.helpers.entity import Entity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.const import (
     UnitOfPower,
@@ -21,15 +21,12 @@ from homeassistant.const import (
     UnitOfElectricPotential,
     UnitOfTemperature,
 )
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     DOMAIN,
-    CONF_MODBUS_IP,
-    CONF_INVERTER_TYPE,
     CONF_PVOUTPUT_API_KEY,
     CONF_PVOUTPUT_SYSTEM_ID,
-    CONF_UPLOAD_INTERVAL,
+    DEFAULT_SLAVE_ID,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,14 +36,18 @@ _LOGGER = logging.getLogger(__name__)
 pvoutput_log_file = os.path.join(os.path.dirname(__file__), 'pvoutput_uploader.log')
 pvoutput_logger = logging.getLogger('pvoutput_uploader')
 pvoutput_logger.setLevel(logging.DEBUG)  # Changed to DEBUG to capture debug messages
-# Rotate log file when it reaches 5MB, keep 1 backup
-handler = RotatingFileHandler(pvoutput_log_file, maxBytes=5*1024*1024, backupCount=1)
-formatter = logging.Formatter('%(asctime)s - [%(levelname)s] - %(message)s')  # Added level name
-handler.setFormatter(formatter)
-# Avoid adding handler multiple times if the module is reloaded
+# Avoid adding handler multiple times if the module is reloaded (modbus_client.py normally adds it first)
 if not pvoutput_logger.handlers:
+    # Rotate log file when it reaches 5MB, keep 1 backup; delay opening it until the first record
+    handler = RotatingFileHandler(pvoutput_log_file, maxBytes=5*1024*1024, backupCount=1, delay=True)
+    formatter = logging.Formatter('%(asctime)s - [%(levelname)s] - %(message)s')  # Added level name
+    handler.setFormatter(formatter)
     pvoutput_logger.addHandler(handler)
 
+# Consecutive failed refreshes after which the next ones are pushed back, and by at most this many seconds
+_BACKOFF_AFTER_FAILURES = 3
+_MAX_REFRESH_BACKOFF = 300
+
 # Define the keys for sensors that are sent to PVOutput
 PVOUTPUT_SENSORS = [
     "solar_energy_today",
@@ -60,51 +61,114 @@ PVOUTPUT_SENSORS = [
     "rvolt_A",
 ]
 
+# Decoders for a sensor's value by (register count, signed). Blocks are packed with their
+# words little-endian, and since the high word is at the higher address, a multi-register
+# value reads back as a single little-endian integer.
+_VALUE_STRUCTS = {
+    (1, False): struct.Struct('<H'),
+    (1, True): struct.Struct('<h'),
+    (2, False): struct.Struct('<I'),
+    (2, True): struct.Struct('<i'),
+    (4, False): struct.Struct('<Q'),
+    (4, True): struct.Struct('<q'),
+}
+
+
+def _required_keys(lambda_registers):
+    """Return the PVOutput sensor keys plus every key they are calculated from.
+
+    Lambda sensors are sums of other sensors, e.g. pv_power_now might be a sum of pv1_power
+    and pv2_power. Each key is expanded once, which also covers nested lambdas.
+    """
+    lambda_sources = {register["key"]: register.get("sources", []) for register in lambda_registers}
+    required = set(PVOUTPUT_SENSORS)
+    stack = list(required)
+    while stack:
+        for source in lambda_sources.get(stack.pop(), ()):
+            if source not in required:
+                required.add(source)
+                stack.append(source)
+    return frozenset(required)
+
+
+def _sensor_ranges(sensor_registers):
+    """Map each (start, count) register range to the sensor registers read from it."""
+    sensors_by_range = {}
+    for register in sensor_registers:
+        addresses = register['addresses']
+        # Multi-register values list the high word first, e.g. [11073, 11072]
+        if (
+            list(addresses) != list(range(addresses[0], addresses[0] - len(addresses), -1))
+            or (len(addresses), False) not in _VALUE_STRUCTS
+        ):
+            _LOGGER.error("Unsupported register layout for %s (%s): %s", register['name'], register['key'], addresses)
+            continue
+        sensors_by_range.setdefault((min(addresses), len(addresses)), []).append(register)
+    return sensors_by_range
+
+
+def _values_struct(layout):
+    """Build a struct that decodes every value in a packed block with a single unpack.
+
+    layout holds (offset, count, format_char, key, scale) per sensor. Returns
+    (values_struct, fields), or (None, None) if two sensors overlap without sharing the same
+    registers and format. fields is (keys, scales, select): select, when not None, picks the
+    unpacked values into the order of keys, so the scaled values can be zipped straight in.
+    """
+    fmt = '<'
+    fields = []
+    indexes = {}
+    position = 0
+    for offset, count, format_char, key, scale in sorted(layout, key=lambda field: field[:3]):
+        field = (offset, count, format_char)
+        if field not in indexes:
+            if offset < position:
+                return None, None
+            if offset > position:
+                fmt += f'{2 * (offset - position)}x'
+            fmt += format_char
+            indexes[field] = len(indexes)
+            position = offset + count
+        fields.append((indexes[field], key, scale))
+
+    keys = tuple(key for _, key, _ in fields)
+    scales = tuple(scale for _, _, scale in fields)
+    order = tuple(index for index, _, _ in fields)
+    # Only sensors sharing a field break the one-to-one order, and then there are at least two
+    select = None if order == tuple(range(len(order))) else operator.itemgetter(*order)
+    return struct.Struct(fmt), (keys, scales, select)
+
+
+# Unit, device class and rounding for a sensor, picked by the first tag found in its key.
+# Power is shown in kW (raw value from coordinator) to 1 decimal place.
+_CATEGORY = [
+    ("power", (UnitOfPower.KILO_WATT, SensorDeviceClass.POWER, 1)),
+    ("energy", (UnitOfEnergy.KILO_WATT_HOUR, SensorDeviceClass.ENERGY, 2)),
+    ("volt", (UnitOfElectricPotential.VOLT, SensorDeviceClass.VOLTAGE, 2)),
+    ("temp", (UnitOfTemperature.CELSIUS, SensorDeviceClass.TEMPERATURE, 2)),
+]
+
+
+def _classify(key: str):
+    """Return (unit, device_class, round_digits) for a sensor key."""
+    return next((category for tag, category in _CATEGORY if tag in key), (None, None, 2))
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up the sensor platform."""
-    config = entry.data
-    modbus_ip = config[CONF_MODBUS_IP]
-    inverter_type = config[CONF_INVERTER_TYPE]
-    upload_interval = config[CONF_UPLOAD_INTERVAL]
-
-    # Load inverter profiles
-    path = os.path.join(os.path.dirname(__file__), 'inverter_profiles.json')
-    def load_profiles():
-        with open(path, "r") as f:
-            return json.load(f)
-    inverter_profiles = await hass.async_add_executor_job(load_profiles)
-    profile = inverter_profiles[inverter_type]
-
-    # Find all dependencies for the PVOutput sensors
-    required_keys = set(PVOUTPUT_SENSORS)
-    
-    # This loop is to make sure we also include sensors that are used in lambda calculations
-    # e.g. pv_power_now might be a sum of pv1_power and pv2_power
-    for _ in range(len(profile)): # Loop to catch nested dependencies
-        for register in profile:
-            key = register.get("key")
-            if key in required_keys and register.get("type") == "lambda":
-                for source in register.get("sources", []):
-                    required_keys.add(source)
-
-    coordinator = FoxESSDataCoordinator(
-        hass, modbus_ip, profile, inverter_type, upload_interval
-    )
-
-    # Set up PVOutput uploader and pass it to the coordinator
-    pvoutput_uploader = PVOutputUploader(hass, config, coordinator)
-    hass.data[DOMAIN][entry.entry_id]["pvoutput_uploader"] = pvoutput_uploader
-    coordinator.set_pvoutput_uploader(pvoutput_uploader)
-    
-    await coordinator.async_config_entry_first_refresh()
-
-    sensors = []
-    for register in profile:
-        key = register.get("key")
-        if key in required_keys:
-            sensors.append(FoxESSSensor(coordinator, key, register))
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    pvoutput_uploader = entry_data["pvoutput_uploader"]
+    sensors = [
+        FoxESSSensor(coordinator, register["key"], register)
+        for register in coordinator.entity_registers
+    ]
 
     async_add_entities(sensors)
+
+    # Without PVOutput credentials there is no uploader to report on
+    if pvoutput_uploader is None:
+        return
     
     pvoutput_status_sensors = [
         PVOutputLastUploadSensor(pvoutput_uploader),
@@ -115,26 +179,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     # Let the uploader know about the sensors so it can trigger updates
     pvoutput_uploader.set_status_sensors(pvoutput_status_sensors)
 
-    # Now that the uploader exists, set up the button platform
-    hass.async_create_task(
-        hass.config_entries.async_forward_entry_setups(entry, ["button"])
-    )
-
 
 class FoxESSDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
-    def __init__(self, hass, modbus_ip, profile, inverter_type, upload_interval_minutes):
+    def __init__(self, hass, modbus_ip, profile, inverter_type, upload_interval_minutes, slave_id=DEFAULT_SLAVE_ID):
         """Initialize."""
         self.modbus_ip = modbus_ip
+        self.slave_id = slave_id
         self.profile = profile
         self.inverter_type = inverter_type
         self.pvoutput_uploader = None
         self.upload_interval_minutes = upload_interval_minutes
+        # Shared by every entity of this inverter
+        self.device_info = {
+            "identifiers": {(DOMAIN, modbus_ip)},
+            "name": f"FoxESS{inverter_type} ({modbus_ip})",
+            "manufacturer": "FoxESS",
+            "model": inverter_type,
+        }
         super().__init__(hass, _LOGGER, name=DOMAIN)
         self._wall_clock_handle = None
+        self._consecutive_failures = 0
+        # Uploads happen on the first refresh and the wall-clock aligned ones, not on every
+        # refresh requested elsewhere, and run in the background so they never hold up a poll
+        self._upload_due = True
+        self._pending_upload: asyncio.Task | None = None
+        self._closed = False
         # Initialize improved Modbus client
-        self._modbus_client = ImprovedModbusClient(hass, modbus_ip, port=502, slave=247)
+        self._modbus_client = ImprovedModbusClient(hass, modbus_ip, port=502, slave=slave_id)
+        # The register layout is fixed per profile, so the block reads are planned once up front.
+        # The profile is only walked here; a replan just regroups the ranges.
+        # Only the sensors that get entities, i.e. those PVOutput needs, are read at all.
+        lambda_registers = [r for r in profile if r.get('type') == 'lambda']
+        self.required_keys = _required_keys(lambda_registers)
+        self.entity_registers = [r for r in profile if r.get('key') in self.required_keys]
+        self._sensors_by_range = _sensor_ranges(
+            r for r in self.entity_registers if r.get('type') == 'sensor'
+        )
+        self._read_plan = self._build_read_plan()
+        self._read_plan_stale = False
+        self._lambda_plan = [
+            (register['key'], tuple(register['sources']), register['name'])
+            for register in lambda_registers
+            if register['key'] in self.required_keys
+        ]
+        # key -> (source values, result) from the last poll, reused while the sources are unchanged
+        self._lambda_cache: dict[str, tuple] = {}
 
     def set_pvoutput_uploader(self, uploader):
         """Set the PVOutput uploader instance."""
@@ -143,74 +234,128 @@ class FoxESSDataCoordinator(DataUpdateCoordinator):
     async def _async_update_data(self):
         """Fetch data from the inverter."""
         try:
-            data = await self._read_modbus_data()
-            if data and self.pvoutput_uploader:
-                await self.pvoutput_uploader.async_upload_data(data)
-            return data
+            # Skip the cycle straight away rather than timing out on every read
+            if not await self._modbus_client.ensure_connected():
+                raise UpdateFailed(f"Unable to connect to inverter at {self.modbus_ip}")
+            # Probe once with the first planned read, so a wrong unit id fails the poll
+            # with one clear error instead of every read timing out in turn
+            if self._read_plan:
+                _, _, members, *_ = self._read_plan[0]
+                if not await self._modbus_client.verify_slave(*members[0]):
+                    raise UpdateFailed(f"No response from unit id {self.slave_id} at {self.modbus_ip}")
+            data = await self._async_read_modbus_data()
+            if self._upload_due and data and self.pvoutput_uploader is not None:
+                self._upload_due = False
+                self._start_upload(data)
+        except UpdateFailed:
+            self._consecutive_failures += 1
+            raise
         except Exception as e:
+            self._consecutive_failures += 1
             raise UpdateFailed(f"Error communicating with inverter: {e}")
-
-    async def _read_modbus_data(self):
+        self._consecutive_failures = 0
+        return data
+
+    def _build_read_plan(self):
+        """Group the sensor registers into as few block reads as possible.
+
+        Returns a list of (start, length, members, block_struct, values_struct, fields,
+        sensors) blocks. block_struct packs the block's registers into bytes; values_struct
+        and fields decode every value of a complete block in one call (see _values_struct),
+        with the keys and scales held as parallel tuples so they can be zipped in directly.
+        sensors holds (key, unpack_from, offset, count, scale, name) for decoding them one
+        at a time when part of the block could not be read. Nothing here refers back to the
+        profile's register dicts, so a poll never looks anything up in them.
+        """
+        sensors_by_range = self._sensors_by_range
+        plan = []
+        for start, length, members in self._modbus_client.plan_blocks(list(sensors_by_range)):
+            sensors = []
+            layout = []
+            for member in members:
+                offset = member[0] - start
+                count = member[1]
+                for register in sensors_by_range[member]:
+                    value_struct = _VALUE_STRUCTS[(count, bool(register.get('signed')))]
+                    scale = register.get('scale')
+                    # Unscaled values stay as ints
+                    scale = 1 if scale is None else scale
+                    sensors.append((register['key'], value_struct.unpack_from, offset, count, scale, register['name']))
+                    layout.append((offset, count, value_struct.format[-1], register['key'], scale))
+            values_struct, fields = _values_struct(layout)
+            plan.append((start, length, members, struct.Struct(f'<{length}H'), values_struct, fields, sensors))
+        return plan
+
+    async def _async_read_modbus_data(self):
         """Read data from Modbus using improved client."""
         data = {}
         
         try:
-            # Read all sensor registers
-            for register in self.profile:
-                if register.get('type') == 'sensor':
-                    key = register['key']
+            # A block that came back incomplete may now overlap registers the inverter rejects
+            if self._read_plan_stale:
+                self._read_plan = self._build_read_plan()
+                self._read_plan_stale = False
+
+            # The connection state is updated once per refresh from these, not per register
+            num_decoded = 0
+            last_error = None
+
+            for start, length, members, block_struct, values_struct, fields, sensors in self._read_plan:
+                try:
+                    registers = await self._modbus_client.read_block(start, length, members)
+                except Exception as e:
+                    _LOGGER.error("Error reading registers: %s", e)
+                    last_error = e
+                    break
+                incomplete = None in registers
+                if incomplete:
+                    self._read_plan_stale = True
+                    raw = block_struct.pack(*(0 if r is None else r for r in registers))
+                else:
+                    raw = block_struct.pack(*registers)
+                    if values_struct is not None:
+                        # The whole block decodes in one call
+                        keys, scales, select = fields
+                        values = values_struct.unpack_from(raw)
+                        if select is not None:
+                            values = select(values)
+                        data.update(zip(keys, map(operator.mul, values, scales)))
+                        num_decoded += len(keys)
+                        continue
+
+                for key, unpack_from, offset, count, scale, name in sensors:
+                    if incomplete and None in registers[offset:offset + count]:
+                        # One of the sensor's registers could not be read
+                        continue
                     try:
-                        address = register['addresses'][0]
-                        count = len(register['addresses'])
-                        
-                        # Skip if in invalid range
-                        if address in self._modbus_client._detected_invalid_ranges:
-                            continue
-                        
-                        # Read registers
-                        registers = await self._modbus_client.read_holding_registers(address, count)
-                        
-                        # Process value
-                        if count > 1:
-                            value = (registers[0] << 16) + registers[1]
-                        else:
-                            value = registers[0]
-                        
-                        # Apply signed conversion if needed
-                        if register.get('signed'):
-                            bit_length = 16 * count
-                            if value & (1 << (bit_length - 1)):
-                                value -= (1 << bit_length)
-                        
-                        # Apply scaling if needed
-                        if 'scale' in register and register['scale'] is not None:
-                            value = value * register['scale']
-                        
-                        data[key] = value
-                        self._modbus_client._update_connection_state(True)
-                        
-                    except ModbusClientFailedError as e:
-                        _LOGGER.warning(f"Error reading {register['name']} ({key}): {e}")
-                        self._modbus_client._update_connection_state(False, e)
+                        data[key] = unpack_from(raw, 2 * offset)[0] * scale
+                        num_decoded += 1
                     except Exception as e:
-                        _LOGGER.error(f"Error reading {register['name']} ({key}): {e}")
-                        self._modbus_client._update_connection_state(False, e)
+                        _LOGGER.error("Error reading %s (%s): %s", name, key, e)
+
+            if num_decoded or last_error:
+                self._modbus_client._update_connection_state(num_decoded > 0, last_error)
             
             # Calculate lambda values
-            for register in self.profile:
-                if register.get('type') == 'lambda':
-                    key = register['key']
-                    try:
-                        sources = [data.get(source_key) for source_key in register['sources']]
-                        if all(s is not None for s in sources):
-                            data[key] = sum(s for s in sources if s is not None)
-                    except Exception as e:
-                        _LOGGER.error(f"Error calculating {register['name']} ({key}): {e}")
+            for key, source_keys, name in self._lambda_plan:
+                try:
+                    sources = tuple(data.get(source_key) for source_key in source_keys)
+                    if None in sources:
+                        continue
+                    cached = self._lambda_cache.get(key)
+                    if cached and cached[0] == sources:
+                        data[key] = cached[1]
+                        continue
+                    # Most lambdas add two sources, e.g. pv1_power and pv2_power
+                    data[key] = sources[0] + sources[1] if len(sources) == 2 else sum(sources)
+                    self._lambda_cache[key] = (sources, data[key])
+                except Exception as e:
+                    _LOGGER.error("Error calculating %s (%s): %s", name, key, e)
             
             return data
             
         except Exception as e:
-            _LOGGER.error(f"Error in Modbus read: {e}")
+            _LOGGER.error("Error in Modbus read: %s", e)
             self._modbus_client._update_connection_state(False, e)
             raise
 
@@ -218,10 +363,30 @@ class FoxESSDataCoordinator(DataUpdateCoordinator):
         await super().async_config_entry_first_refresh()
         self._schedule_wall_clock_refresh()
     
+    def _start_upload(self, data):
+        """Upload to PVOutput in the background, unless the previous upload is still running."""
+        if self._pending_upload and not self._pending_upload.done():
+            _LOGGER.debug("Previous PVOutput upload still in progress, skipping this one.")
+            return
+        self._pending_upload = self.hass.async_create_background_task(
+            self.pvoutput_uploader.async_upload_data(data), name="pvoutput_upload"
+        )
+
     async def async_shutdown(self):
         """Clean up resources."""
+        self._closed = True
+        await super().async_shutdown()
+        if self._pending_upload and not self._pending_upload.done():
+            self._pending_upload.cancel()
+        self._pending_upload = None
+        # Stop the wall-clock refreshes, which would otherwise keep polling after unload
+        if self._wall_clock_handle:
+            self._wall_clock_handle.cancel()
+            self._wall_clock_handle = None
         if hasattr(self, '_modbus_client') and self._modbus_client:
             await self._modbus_client.close()
+        if self.pvoutput_uploader:
+            await self.pvoutput_uploader.async_close()
 
     def _schedule_wall_clock_refresh(self):
         if self._wall_clock_handle:
@@ -236,33 +401,42 @@ class FoxESSDataCoordinator(DataUpdateCoordinator):
         else:
             next_time = next_time.replace(minute=next_minute)
         delay = (next_time - now).total_seconds()
-        loop = asyncio.get_event_loop()
-        self._wall_clock_handle = loop.call_later(delay, lambda: asyncio.create_task(self._wall_clock_refresh()))
+        # Poll an inverter that keeps failing (e.g. switched off) less and less often
+        if self._consecutive_failures > _BACKOFF_AFTER_FAILURES:
+            delay += min(2 ** self._consecutive_failures, _MAX_REFRESH_BACKOFF)
+        loop = self.hass.loop
+        self._wall_clock_handle = loop.call_at(
+            loop.time() + delay, lambda: self.hass.async_create_task(self._wall_clock_refresh())
+        )
 
     async def _wall_clock_refresh(self):
-        await self.async_request_refresh()
-        self._schedule_wall_clock_refresh()
+        self._upload_due = True
+        try:
+            # Refresh right away rather than through the debouncer, so it is this refresh that uploads
+            await self.async_refresh()
+        finally:
+            # Only scheduled ticks upload, so a failed one doesn't hand its upload to the next refresh
+            self._upload_due = False
+        # The entry may have been unloaded while the refresh ran
+        if not self._closed:
+            self._schedule_wall_clock_refresh()
 
 
 class FoxESSSensor(Entity):
     """Representation of a FoxESS sensor."""
 
+    # No need to poll. Coordinator notifies entity of updates.
+    _attr_should_poll = False
+
     def __init__(self, coordinator: FoxESSDataCoordinator, key: str, register_info: dict):
         """Initialize the sensor."""
         self.coordinator = coordinator
         self._key = key
         self._register_info = register_info
         self._name = register_info.get("name", key)
-
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.modbus_ip)},
-            "name": f"FoxESS{self.coordinator.inverter_type} ({self.coordinator.modbus_ip})",
-            "manufacturer": "FoxESS",
-            "model": self.coordinator.inverter_type,
-        }
+        self._attr_device_info = coordinator.device_info
+        # The key decides the unit and class, so resolve them once rather than on every state write
+        self._attr_unit_of_measurement, self._attr_device_class, self._round_digits = _classify(key)
 
     @property
     def unique_id(self):
@@ -274,51 +448,18 @@ class FoxESSSensor(Entity):
         """Return the name of the sensor."""
         return f"FoxESS {self._name}"
 
-    @property
-    def state(self):
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            value = self.coordinator.data.get(self._key)
-            if value is None:
-                return None
-            # Show power in kW (raw value from coordinator), rounded to 1 decimal place
-            if "power" in self._key and isinstance(value, (int, float)):
-                return round(value, 1)
-            if isinstance(value, float):
-                return round(value, 2)
-            return value
-        return None
-
-    @property
-    def unit_of_measurement(self):
-        """Return the unit of measurement."""
-        if "power" in self._key:
-            return "kW"
-        if "energy" in self._key:
-            return UnitOfEnergy.KILO_WATT_HOUR
-        if "volt" in self._key:
-            return UnitOfElectricPotential.VOLT
-        if "temp" in self._key:
-            return UnitOfTemperature.CELSIUS
-        return None
-
-    @property
-    def device_class(self):
-        """Return the device class."""
-        if "power" in self._key:
-            return SensorDeviceClass.POWER
-        if "energy" in self._key:
-            return SensorDeviceClass.ENERGY
-        if "volt" in self._key:
-            return SensorDeviceClass.VOLTAGE
-        if "temp" in self._key:
-            return SensorDeviceClass.TEMPERATURE
-        return None
+    def _update_state(self):
+        """Round the latest value once per coordinator update, rather than on every state read."""
+        data = self.coordinator.data
+        # The coordinator only stores numbers, decoded from registers or summed from them
+        value = data.get(self._key) if data else None
+        self._attr_state = None if value is None else round(value, self._round_digits)
 
-    @property
-    def should_poll(self):
-        """No need to poll. Coordinator notifies entity of updates."""
-        return False
+    @callback
+    def _handle_coordinator_update(self):
+        """Handle updated data from the coordinator."""
+        self._update_state()
+        self.async_write_ha_state()
 
     @property
     def available(self):
@@ -331,8 +472,9 @@ class FoxESSSensor(Entity):
 
     async def async_added_to_hass(self):
         """When entity is added to hass."""
+        self._update_state()
         self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
 
 
@@ -346,77 +488,132 @@ class PVOutputUploader:
         self._system_id = config.get(CONF_PVOUTPUT_SYSTEM_ID, "").strip()
         self._coordinator = coordinator
         self._url = "https://pvoutput.org/service/r2/addstatus.jsp"
-        self.last_success_timestamp = None
+        # Grid voltage is taken from the first of these the profile provides
+        self._voltage_keys = ('rvolt', 'grid_voltage_R', 'rvolt_R', 'rvolt_A')
+        self._static_headers = {
+            "X-Pvoutput-Apikey": self._api_key,
+            "X-Pvoutput-SystemId": self._system_id,
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
+        # Created on the first upload, see _get_session
+        self._session: aiohttp.ClientSession | None = None
+        self._last_success_dt: datetime | None = None
         self.last_status_code = None
         self._status_sensors = []
+        # Values of the last successful upload, used to skip posting the same figures again
+        self._last_payload_key = None
+        # What the status sensors last showed, so they are only written when it changes
+        self._prev_status = (None, None)
         
         # The coordinator will now trigger the upload, so we don't need a listener here.
 
+    @property
+    def last_success_timestamp(self) -> str | None:
+        """Return the time of the last successful upload, formatted only when asked for."""
+        return self._last_success_dt.isoformat() if self._last_success_dt else None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the uploader's own HTTP session, creating it on first use.
+
+        A session of our own keeps the single connection to pvoutput.org alive between uploads,
+        rather than it being dropped from HA's shared pool and renegotiating TLS each time.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=1,
+                keepalive_timeout=max(self._coordinator.upload_interval_minutes * 60 * 2, 1800),
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self._static_headers,
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self._session
+
+    async def async_close(self):
+        """Close the uploader's HTTP session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
     def set_status_sensors(self, sensors):
         """Register sensors to receive updates."""
         self._status_sensors = sensors
 
-    async def async_upload_data(self, data: dict | None = None):
-        """Upload data to PVOutput. If data is not provided, it uses the latest from the coordinator."""
+    async def async_upload_data(self, data: dict | None = None, force: bool = False):
+        """Upload data to PVOutput. If data is not provided, it uses the latest from the coordinator.
+
+        Unchanged values are only re-sent once an hour unless force is set.
+        """
         if data is None:
             data = self._coordinator.data
         
         if not data:
             return
 
-        required_keys = ['solar_energy_today', 'pv_power_now', 'grid_consumption_energy_today', 'load_power']
-        if not all(k in data for k in required_keys):
+        # Take the time once so the date and time can't straddle midnight
+        now = datetime.now()
+        try:
+            # kWh and kW from the inverter, Wh and W for PVOutput
+            payload = {
+                'd': f"{now.year:04d}{now.month:02d}{now.day:02d}",
+                't': f"{now.hour:02d}:{now.minute:02d}",
+                'v1': int(data['solar_energy_today'] * 1000),
+                'v2': int(data['pv_power_now'] * 1000),
+                'v3': int(data['grid_consumption_energy_today'] * 1000),
+                'v4': int(data['load_power'] * 1000),
+            }
+        except KeyError:
             _LOGGER.warning("Missing required data for PVOutput upload. Skipping.")
             return
 
-        grid_voltage = data.get('rvolt')
-        if grid_voltage is None:
-            grid_voltage = data.get('grid_voltage_R', data.get('rvolt_R', data.get('rvolt_A')))
-
-        payload = {
-            'd': datetime.now().strftime('%Y%m%d'),
-            't': datetime.now().strftime('%H:%M'),
-            'v1': int(data['solar_energy_today'] * 1000),
-            'v2': int(data['pv_power_now'] * 1000),
-            'v3': int(data['grid_consumption_energy_today'] * 1000),
-            'v4': int(data['load_power'] * 1000),
-        }
-        if data.get('invtemp') is not None:
-            payload['v5'] = round(data['invtemp'], 2)
+        inverter_temp = data.get('invtemp')
+        if inverter_temp is not None:
+            payload['v5'] = round(inverter_temp, 2)
+        grid_voltage = next((data[k] for k in self._voltage_keys if data.get(k) is not None), None)
         if grid_voltage is not None:
             payload['v6'] = round(grid_voltage, 2)
 
-        headers = {
-            "X-Pvoutput-Apikey": self._api_key,
-            "X-Pvoutput-SystemId": self._system_id,
-            "Content-Type": "application/x-www-form-urlencoded"
-        }
-        
-        # Don't upload if key/system_id is missing
-        if not self._api_key or not self._system_id:
-            _LOGGER.debug("PVOutput API Key or System ID is not configured, skipping upload.")
+        # Nothing changes overnight, so don't spend a request (and PVOutput's rate limit) on it
+        payload_key = (
+            payload['d'], payload['v1'], payload['v2'], payload['v3'], payload['v4'],
+            payload.get('v5'), payload.get('v6'),
+        )
+        if (
+            not force
+            and payload_key == self._last_payload_key
+            and self._last_success_dt
+            and (now - self._last_success_dt).total_seconds() < 3600
+        ):
+            pvoutput_logger.debug("Data unchanged since the last upload, skipping.")
             return
 
-        pvoutput_logger.info(f"Uploading to PVOutput. Payload: {payload}")
-        websession = async_get_clientsession(self._hass)
+        pvoutput_logger.info("Uploading to PVOutput. Payload: %s", payload)
         try:
-            async with websession.post(self._url, headers=headers, data=payload, timeout=10) as response:
+            # Send the form already encoded; the session sets its Content-Type
+            body = urlencode(payload).encode('ascii')
+            async with self._get_session().post(self._url, data=body) as response:
                 response_text = await response.text()
                 self.last_status_code = response.status
-                pvoutput_logger.info(f"PVOutput response. Status: {response.status}, Response: {response_text.strip()}")
+                pvoutput_logger.info("PVOutput response. Status: %s, Response: %s", response.status, response_text.strip())
                 if response.status == 200:
-                    _LOGGER.info(f"Successfully uploaded to PVOutput. Response: {response_text}")
-                    self.last_success_timestamp = datetime.now().isoformat()
+                    _LOGGER.info("Successfully uploaded to PVOutput. Response: %s", response_text)
+                    self._last_success_dt = datetime.now()
+                    self._last_payload_key = payload_key
                 else:
-                    _LOGGER.warning(f"Failed to upload to PVOutput. Status: {response.status}, Response: {response_text}")
+                    _LOGGER.warning("Failed to upload to PVOutput. Status: %s, Response: %s", response.status, response_text)
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            pvoutput_logger.error(f"Error uploading to PVOutput: {e}")
-            _LOGGER.error(f"Error uploading to PVOutput: {e}")
+            pvoutput_logger.error("Error uploading to PVOutput: %s", e)
+            _LOGGER.error("Error uploading to PVOutput: %s", e)
             self.last_status_code = "Error"
         
-        # Manually update state of our status sensors
-        for sensor in self._status_sensors:
-            sensor.async_schedule_update_ha_state()
+        # Manually update state of our status sensors, unless e.g. a run of failures left them as they were
+        status = (self._last_success_dt, self.last_status_code)
+        if status != self._prev_status:
+            self._prev_status = status
+            for sensor in self._status_sensors:
+                sensor.async_schedule_update_ha_state()
 
 
 class PVOutputStatusSensorBase(Entity):
@@ -428,17 +625,8 @@ class PVOutputStatusSensorBase(Entity):
         """Initialize the sensor."""
         self._uploader = uploader
         self._coordinator = uploader._coordinator
+        self._attr_device_info = self._coordinator.device_info
 
-    @property
-    def device_info(self):
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._coordinator.modbus_ip)},
-            "name": f"FoxESS{self._coordinator.inverter_type} ({self._coordinator.modbus_ip})",
-            "manufacturer": "FoxESS",
-            "model": self._coordinator.inverter_type,
-        }
-    
     @property
     def available(self):
         """Return if entity is available."""
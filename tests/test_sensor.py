@@ -0,0 +1,64 @@
+"""Tests for the FoxESS data coordinator."""
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+try:
+    from homeassistant.helpers.update_coordinator import UpdateFailed
+
+    from custom_components.pvoutput_foxess.sensor import FoxESSDataCoordinator
+except ImportError:
+    raise unittest.SkipTest("Home Assistant is not installed")
+
+
+def _coordinator():
+    """Build a coordinator without Home Assistant, reading through mocks."""
+    coordinator = FoxESSDataCoordinator.__new__(FoxESSDataCoordinator)
+    coordinator.modbus_ip = "192.0.2.1"
+    coordinator.slave_id = 247
+    coordinator.pvoutput_uploader = Mock()
+    coordinator._modbus_client = Mock(ensure_connected=AsyncMock(return_value=True))
+    coordinator._read_plan = []
+    coordinator._async_read_modbus_data = AsyncMock()
+    coordinator._start_upload = Mock()
+    coordinator._schedule_wall_clock_refresh = Mock()
+    coordinator._consecutive_failures = 0
+    coordinator._upload_due = False
+    coordinator._closed = False
+
+    async def refresh():
+        # Like DataUpdateCoordinator.async_refresh, which logs a failed update instead of raising it
+        try:
+            await coordinator._async_update_data()
+        except UpdateFailed:
+            pass
+
+    coordinator.async_refresh = refresh
+    return coordinator
+
+
+class WallClockUploadTest(unittest.TestCase):
+    def test_scheduled_refresh_uploads(self):
+        coordinator = _coordinator()
+        coordinator._async_read_modbus_data.return_value = {"pv_power": 1.0}
+
+        asyncio.run(coordinator._wall_clock_refresh())
+
+        coordinator._start_upload.assert_called_once_with({"pv_power": 1.0})
+        self.assertFalse(coordinator._upload_due)
+
+    def test_failed_scheduled_refresh_does_not_upload_on_next_refresh(self):
+        coordinator = _coordinator()
+        coordinator._async_read_modbus_data.side_effect = [OSError("timed out"), {"pv_power": 1.0}]
+
+        asyncio.run(coordinator._wall_clock_refresh())
+        self.assertFalse(coordinator._upload_due)
+
+        # A refresh requested outside the schedule, e.g. manually, succeeds but must not upload
+        asyncio.run(coordinator._async_update_data())
+
+        coordinator._start_upload.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()